@@ -5,8 +5,10 @@ import sys
 
 from flask import Flask
 
-from . import commands
+from . import auth, commands
 from .blueprint import blueprint
+from .common import logging as request_logging
+from .common.json_provider import OrjsonProvider
 
 
 def create_app(config_object="app.settings"):
@@ -15,7 +17,10 @@ def create_app(config_object="app.settings"):
     :param config_object: The configuration object to use.
     """
     app = Flask(__name__.split(".")[0])
+    app.json = OrjsonProvider(app)
     app.config.from_object(config_object)
+    auth.init_app(app)
+    request_logging.init_app(app)
     register_commands(app)
     register_blueprints(app)
     configure_logger(app)
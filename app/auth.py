@@ -1,14 +1,28 @@
 """Authentication module."""
 
+import hmac
 from functools import wraps
 
-from flask import Response, current_app, request
+from flask import Response, request
+
+# Service API key as bytes, cached once at startup by init_app()
+_SERVICE_API_KEY = b""
+
+
+def init_app(app):
+    """Cache the configured service API key for request-time validation."""
+    global _SERVICE_API_KEY
+    _SERVICE_API_KEY = app.config["SERVICE_API_KEY"].encode("utf-8")
 
 
 def valid_brearer_token():
-    """Validate the bearer token."""
-    service_api_key = current_app.config["SERVICE_API_KEY"]
-    return request.authorization and request.authorization.token == service_api_key
+    """Validate the bearer token (constant-time comparison)."""
+    auth = request.authorization
+    return bool(
+        auth
+        and auth.token
+        and hmac.compare_digest(auth.token.encode("utf-8"), _SERVICE_API_KEY)
+    )
 
 
 def require_auth(func):
@@ -2,20 +2,58 @@
 
 from __future__ import annotations
 
-import json
-import re
-from typing import Optional
+import http.cookiejar
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 
+import orjson
 import requests
-from flask import Request, Response
+from flask import Request, Response, current_app
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..common.logging import console
 from ..common.recording import record_payload
 
 # Local adapters
 from .request_adapter import RequestAdapter
 from .response_adapter import ResponseAdapter
 
+# Shared session so upstream keep-alive connections (and their TLS sessions)
+# are reused across requests instead of being re-established every time.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=50, pool_maxsize=200, max_retries=Retry(total=0)),
+)
+# The session is shared by every client of the proxy: never store cookies set
+# upstream (Azure, APIM, Front Door), or they would leak across callers
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+_ERROR_REPORT_TEMPLATE = (
+    '\nCheck "azure_response" for the error details:\n'
+    "\t{report}\n"
+    "If the issue persists, report it to:\n"
+    "\thttps://github.com/gabrii/Cursor-Azure-GPT-5/issues\n"
+    "Including all the details above"
+)
+
+
+def _mask_middle(value: str) -> str:
+    """Keep the first and last 3 characters of value, masking the rest."""
+    if len(value) < 6:
+        return value
+    return value[:3] + "***" + value[-3:]
+
+
+def _redact_endpoint(url: str) -> str:
+    """Mask the Azure resource name (first host label) of an endpoint URL."""
+    parts = urlsplit(url)
+    label, dot, domain = parts.netloc.partition(".")
+    if not dot or len(label) < 2:
+        return url
+    netloc = label[0] + "***" + label[-1] + dot + domain
+    return parts._replace(netloc=netloc).geturl()
+
 
 class AzureAdapter:
     """Orchestrate forwarding of a Flask Request to Azure's Responses API.
@@ -23,12 +61,13 @@ class AzureAdapter:
     Provides a Completions-compatible interface to the caller by composing a
     RequestAdapter (pre-request transformations) and a ResponseAdapter
     (post-request transformations). The adapters receive a reference to this
-    instance for shared per-request state (models/early_response).
+    instance for shared per-request state (models/early_response/upstream_body).
     """
 
     # Per-request state (streaming completions only)
     inbound_model: Optional[str] = None
     early_response: Optional[Response] = None
+    upstream_body: Optional[Dict[str, Any]] = None
 
     def __init__(self) -> None:
         """Initialize child adapters and shared state references."""
@@ -43,7 +82,7 @@ class AzureAdapter:
         High-level flow:
         1) RequestAdapter builds the upstream request kwargs and stores state
            on this adapter (models) or sets early_response.
-        2) Perform the upstream HTTP call using a short-lived requests call.
+        2) Perform the upstream HTTP call using the shared pooled session.
         3) ResponseAdapter converts the upstream response into a Flask Response.
         """
         request_kwargs = self.request_adapter.adapt(req)
@@ -52,23 +91,23 @@ class AzureAdapter:
         if self.early_response is not None:
             return self.early_response
 
-        record_payload(request_kwargs.get("json", {}), "upstream_request")
+        record_payload(self.upstream_body or {}, "upstream_request")
 
-        # Perform upstream request with kwargs directly (no long-lived session)
-        resp = requests.request(**request_kwargs)
+        # Perform upstream request through the pooled session; closing the
+        # streamed response releases the connection back to the pool
+        resp = _SESSION.request(**request_kwargs)
         if resp.status_code != 200:
             return self._handle_azure_error(resp, request_kwargs)
 
         return self.response_adapter.adapt(resp)
 
     def _handle_azure_error(self, resp: Response, request_kwargs) -> Response:
-
         try:
             resp_content = resp.json()
         except ValueError:
-            resp_content = resp.content
+            resp_content = resp.text
 
-        body = request_kwargs.get("json", {})
+        body = self.upstream_body or {}
         if "instructions" in body:
             body["instructions"] = body["instructions"][:7] + "..."
 
@@ -79,27 +118,34 @@ class AzureAdapter:
             body["input"] = f"...redacted {len(body['input'])} input items..."
 
         if "prompt_cache_key" in body:
-            body["prompt_cache_key"] = re.sub(
-                r"(...)(.*)(...)", "\\1***\\3", body["prompt_cache_key"]
-            )
+            body["prompt_cache_key"] = _mask_middle(body["prompt_cache_key"])
         report = {
-            "endpoint": re.sub(
-                r"(//.)(.*?)(.\.)", "\\1***\\3", request_kwargs.get("url")
-            ),
+            "endpoint": _redact_endpoint(request_kwargs.get("url")),
             "azure_response": resp_content,
             "request_body": body,
         }
-        # Precompute pretty JSON to avoid backslashes inside f-string expressions
-        report_pretty = json.dumps(report, indent=4).replace("\n", "\n\t")
-        error_message = (
-            '\nCheck "azure_response" for the error details:\n'
-            f"\t{report_pretty}\n"
-            "If the issue persists, report it to:\n"
-            "\thttps://github.com/gabrii/Cursor-Azure-GPT-5/issues\n"
-            "Including all the details above"
+        report_pretty = (
+            orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            .decode("utf-8")
+            .replace("\n", "\n\t")
         )
-        console.rule(f"[red]Request failed with status code {resp.status_code}[/red]")
-        console.print(error_message)
+        error_message = _ERROR_REPORT_TEMPLATE.format(report=report_pretty)
+        if current_app.config["AZURE_VERBOSE_ERRORS"]:
+            # Only needed on the error path; keep Rich out of module import
+            from ..common.logging import console
+
+            console.rule(
+                f"[red]Request failed with status code {resp.status_code}[/red]"
+            )
+            console.print(error_message)
+        else:
+            # One compact line per failure, so error storms don't stall workers
+            # and line-oriented log ingestion keeps one record per error
+            current_app.logger.warning(
+                "Azure request failed with status code %s: %s",
+                resp.status_code,
+                orjson.dumps(report).decode("utf-8"),
+            )
         return Response(
             error_message,
             status=resp.status_code,
@@ -6,11 +6,58 @@ requests into Azure Responses API request parameters.
 
 from __future__ import annotations
 
-import json
+import hashlib
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import orjson
 from flask import Request, Response, current_app
 
+# Inbound headers worth forwarding to Azure (everything else is dropped,
+# including Host, Authorization and Cookie)
+_FORWARDED_HEADERS = frozenset(
+    {"content-type", "accept", "accept-encoding", "user-agent"}
+)
+
+# Inbound model name -> reasoning effort ("gpt-high" and plain "high" forms)
+_REASONING_EFFORTS = ("high", "medium", "low", "minimal")
+_EFFORT_BY_MODEL = {
+    **{f"gpt-{effort}": effort for effort in _REASONING_EFFORTS},
+    **{effort: effort for effort in _REASONING_EFFORTS},
+}
+
+# Content part types whose "text" field carries the message text
+_TEXT_TYPES = frozenset({"text", "input_text"})
+
+
+def _content_part_to_text(part: Any) -> str:
+    """Return the text of a single message content part ("" if it has none)."""
+    if isinstance(part, dict):
+        if part.get("type") in _TEXT_TYPES and "text" in part:
+            return str(part["text"])
+        content = part.get("content")
+        return content if isinstance(content, str) else ""
+    return str(part)
+
+
+def _content_to_text(c: Any) -> str:
+    """Flatten a Chat message content value into plain text."""
+    # Ordered by frequency: plain strings are the vast majority of messages
+    cls = c.__class__
+    if cls is str:
+        return c
+    if c is None:
+        return ""
+    if cls is list:
+        return "\n".join(filter(None, map(_content_part_to_text, c)))
+    return orjson.dumps(c).decode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _sha256_hex(value: str) -> str:
+    """Return the SHA-256 hex digest of value (cached across requests)."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
 
 class RequestAdapter:
     """Handle pre-request adaptation for the Azure Responses API.
@@ -20,7 +67,7 @@ class RequestAdapter:
     Returns request_kwargs for requests.request(**kwargs). If an early
     short-circuit is needed (for example, missing config), sets
     self.adapter.early_response and returns an empty dict. Also sets
-    per-request state on the adapter (model).
+    per-request state on the adapter (model, upstream body).
     """
 
     def __init__(self, adapter: Any) -> None:
@@ -45,30 +92,27 @@ class RequestAdapter:
             return mapping.get(original, original)
         if original in mapping:
             return mapping[original]
-        import hashlib
-
-        norm = hashlib.sha256(original.encode("utf-8")).hexdigest()  # 64 hex chars
+        # Long ids recur on every turn of an agentic session
+        norm = _sha256_hex(original)  # 64 hex chars
         mapping[original] = norm
         return norm
 
-    def _parse_json_body(self, req: Request, body: bytes) -> Optional[Any]:
+    def _parse_json_body(self, body: bytes) -> Optional[Any]:
+        # Parse the raw bytes once, regardless of the declared Content-Type
         if not body:
             return None
-        data = req.get_json(silent=True, force=False)
-        if data is not None:
-            return data
         try:
-            return json.loads(body.decode(req.charset or "utf-8", errors="replace"))
-        except json.JSONDecodeError:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
             return None
 
     def _copy_request_headers_for_azure(
         self, src: Request, *, api_key: str
     ) -> Dict[str, str]:
-        headers: Dict[str, str] = {k: v for k, v in src.headers.items()}
-        headers.pop("Host", None)
+        headers: Dict[str, str] = {
+            k: v for k, v in src.headers.items() if k.lower() in _FORWARDED_HEADERS
+        }
         # Azure prefers api-key header
-        headers.pop("Authorization", None)
         headers["api-key"] = api_key
         return headers
 
@@ -78,74 +122,64 @@ class RequestAdapter:
         instructions_parts: List[str] = []
         input_items: List[Dict[str, Any]] = []
 
-        def content_to_text(c: Any) -> str:
-            if c is None:
-                return ""
-            if isinstance(c, str):
-                return c
-            if isinstance(c, list):
-                parts: List[str] = []
-                for it in c:
-                    if isinstance(it, dict):
-                        if it.get("type") in {"text", "input_text"} and "text" in it:
-                            parts.append(str(it.get("text", "")))
-                        elif "content" in it and isinstance(it["content"], str):
-                            parts.append(it["content"])
-                    else:
-                        parts.append(str(it))
-                return "\n".join([p for p in parts if p])
-            return json.dumps(c, ensure_ascii=False)
+        # Bind hot lookups to locals; this loop runs over the whole history.
+        # (Not pre-sized: one assistant message can expand into many tool calls.)
+        append_input = input_items.append
+        append_instructions = instructions_parts.append
+        content_to_text = _content_to_text
+        normalize_call_id = self._normalize_call_id
 
         # Maintain stable mapping of long tool call ids within a single request
         call_id_map: Dict[str, str] = {}
 
         for m in messages:
-            role = m.get("role")
-            c = m.get("content")
-            if role in {"system", "developer"}:
+            get = m.get
+            role = get("role")
+            c = get("content")
+            if role == "system" or role == "developer":
                 text = content_to_text(c)
                 if text:
-                    instructions_parts.append(text)
+                    append_instructions(text)
                 continue
             # For user/assistant/tools as inputs
             if role == "tool":
                 # Map tool outputs back to a normalized call id
-                original_tool_call_id = m.get("tool_call_id")
-                norm_call_id = self._normalize_call_id(
-                    original_tool_call_id, call_id_map
+                append_input(
+                    {
+                        "type": "function_call_output",
+                        "output": content_to_text(c),
+                        "status": "completed",
+                        "call_id": normalize_call_id(get("tool_call_id"), call_id_map),
+                    }
                 )
-                item = {
-                    "type": "function_call_output",
-                    "output": content_to_text(c),
-                    "status": "completed",
-                    "call_id": norm_call_id,
-                }
-                input_items.append(item)
             else:
-                text = content_to_text(c)
-                item = {
-                    "role": role or "user",
-                    "content": [
-                        {
-                            "type": "input_text" if role == "user" else "output_text",
-                            "text": text,
-                        },
-                    ],
-                }
-                input_items.append(item)
+                append_input(
+                    {
+                        "role": role or "user",
+                        "content": [
+                            {
+                                "type": (
+                                    "input_text" if role == "user" else "output_text"
+                                ),
+                                "text": content_to_text(c),
+                            },
+                        ],
+                    }
+                )
 
-                if tool_calls := m.get("tool_calls"):
+                if tool_calls := get("tool_calls"):
                     for tool_call in tool_calls:
                         function = tool_call.get("function", {})
-                        original_id = tool_call.get("id")
-                        norm_call_id = self._normalize_call_id(original_id, call_id_map)
-                        item = {
-                            "type": "function_call",
-                            "name": function.get("name"),
-                            "arguments": function.get("arguments"),
-                            "call_id": norm_call_id,
-                        }
-                        input_items.append(item)
+                        append_input(
+                            {
+                                "type": "function_call",
+                                "name": function.get("name"),
+                                "arguments": function.get("arguments"),
+                                "call_id": normalize_call_id(
+                                    tool_call.get("id"), call_id_map
+                                ),
+                            }
+                        )
 
         instructions = "\n\n".join(instructions_parts) if instructions_parts else None
         return {
@@ -178,6 +212,19 @@ class RequestAdapter:
                 out.append(t)
         return out
 
+    @staticmethod
+    def _reasoning_effort(model: Any) -> Optional[str]:
+        """Return the reasoning effort selected by the model name, or None."""
+        if not isinstance(model, str):
+            return None
+        effort = _EFFORT_BY_MODEL.get(model)
+        if effort is None:
+            # Rare variants such as "gpt-High" keep the original normalization
+            effort = model.replace("gpt-", "").lower()
+            if effort not in _REASONING_EFFORTS:
+                return None
+        return effort
+
     def _transform_tool_choice(self, tool_choice: Any) -> Any:
         if tool_choice in (None, "auto", "none"):
             return tool_choice
@@ -201,6 +248,7 @@ class RequestAdapter:
         # Reset per-request state
         self.adapter.inbound_model = None
         self.adapter.early_response = None
+        self.adapter.upstream_body = None
 
         # Validate method
         if (req.method or "").upper() != "POST":
@@ -213,7 +261,7 @@ class RequestAdapter:
 
         # Parse request body
         raw_body = req.get_data(cache=True)
-        payload = self._parse_json_body(req, raw_body)
+        payload = self._parse_json_body(raw_body)
         if not isinstance(payload, dict):
             payload = {}
 
@@ -221,6 +269,15 @@ class RequestAdapter:
         inbound_model = payload.get("model") if isinstance(payload, dict) else None
         self.adapter.inbound_model = inbound_model
 
+        reasoning_effort = self._reasoning_effort(inbound_model)
+        if reasoning_effort is None:
+            self.adapter.early_response = Response(
+                "Model name must be either gpt-high, gpt-medium, gpt-low, or gpt-minimal",
+                status=400,
+                mimetype="text/plain",
+            )
+            return {}
+
         settings = current_app.config
 
         upstream_headers = self._copy_request_headers_for_azure(
@@ -266,12 +323,6 @@ class RequestAdapter:
         # Always streaming
         responses_body["stream"] = True
 
-        reasoning_effort = inbound_model.replace("gpt-", "").lower()
-        if reasoning_effort not in {"high", "medium", "low", "minimal"}:
-            raise ValueError(
-                "Model name must be either gpt-high, gpt-medium, gpt-low, or gpt-minimal"
-            )
-
         responses_body["reasoning"] = {
             "effort": reasoning_effort,
         }
@@ -285,12 +336,16 @@ class RequestAdapter:
         responses_body["stream_options"] = {"include_obfuscation": False}
         responses_body["truncation"] = settings["AZURE_TRUNCATION"]
 
+        # Serialize once; keep the dict around for recording and error reports
+        self.adapter.upstream_body = responses_body
+        upstream_headers["Content-Type"] = "application/json"
+
         request_kwargs: Dict[str, Any] = {
             "method": "POST",
             "url": settings["AZURE_RESPONSES_API_URL"],
             "headers": upstream_headers,
-            "json": responses_body,
-            "data": None,
+            "json": None,
+            "data": orjson.dumps(responses_body),
             "stream": True,
             "timeout": (60, None),
         }
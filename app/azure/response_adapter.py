@@ -9,11 +9,19 @@ from __future__ import annotations
 import random
 import time
 from string import ascii_letters, digits
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
 
-from flask import Response
+from flask import Response, stream_with_context
 
-from ..common.sse import chunks_to_sse, sse_to_events
+from ..common.sse import SSEDecoder, SSEEvent, chunks_to_sse
+
+# Bounds for merging consecutive output_text deltas into a single chunk
+COALESCE_MAX_CHARS = 256
+COALESCE_MAX_DELAY = 0.02  # seconds
+
+# Upper bound per upstream read. Chunked SSE is still yielded per HTTP chunk,
+# so a larger size means fewer iterations without delaying small events.
+UPSTREAM_READ_SIZE = 64 * 1024
 
 
 class ResponseAdapter:
@@ -26,6 +34,22 @@ class ResponseAdapter:
 
     # Per-request chat completion id (for streaming)
     _chat_completion_id: Optional[str] = None
+    # Minimal hop-by-hop headers list for downstream filtering
+    _HOP_BY_HOP = frozenset(
+        {
+            "connection",
+            "keep-alive",
+            "proxy-authenticate",
+            "proxy-authorization",
+            "te",
+            "trailers",
+            "transfer-encoding",
+            "upgrade",
+        }
+    )
+
+    # Per-stream chunk fields that never change (id/object/created/model)
+    _chunk_skeleton: Optional[Dict[str, Any]] = None
 
     def __init__(self, adapter: Any) -> None:
         """Initialize the adapter with a reference to the AzureAdapter."""
@@ -38,27 +62,16 @@ class ResponseAdapter:
         alphabet = ascii_letters + digits
         return "chatcmpl-" + "".join(random.choices(alphabet, k=24))
 
-    @staticmethod
+    @classmethod
     def _filter_response_headers(
-        headers: Dict[str, str], *, streaming: bool
+        cls, headers: Mapping[str, str], *, streaming: bool
     ) -> Dict[str, str]:
         """Filter hop-by-hop and incompatible headers for downstream responses."""
-        # Minimal hop-by-hop headers list for downstream filtering
-        hop_by_hop_headers = {
-            "connection",
-            "keep-alive",
-            "proxy-authenticate",
-            "proxy-authorization",
-            "te",
-            "trailers",
-            "transfer-encoding",
-            "upgrade",
-        }
+        hop_by_hop = cls._HOP_BY_HOP
         out: Dict[str, str] = {}
         for k, v in headers.items():
-            if k.lower() in hop_by_hop_headers:
-                continue
-            if streaming and k.lower() == "content-length":
+            name = k.lower()
+            if name in hop_by_hop or (streaming and name == "content-length"):
                 continue
             out[k] = v
         return out
@@ -71,10 +84,7 @@ class ResponseAdapter:
     ) -> Dict[str, Any]:
         """Build a Chat Completions chunk dict with the provided delta."""
         return {
-            "id": self._chat_completion_id,
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": self.adapter.inbound_model,
+            **self._chunk_skeleton,
             "choices": [
                 {
                     "index": 0,
@@ -85,10 +95,11 @@ class ResponseAdapter:
         }
 
     # ---- Event handlers (per SSE event) ----
-    def _output_item__added(
-        self, obj: Optional[Dict[str, Any]]
-    ) -> Iterable[Dict[str, Any]]:
+    # Delta handlers read ev.delta, which avoids a full JSON parse per token;
+    # the remaining (rare) events use the fully parsed ev.json.
+    def _output_item__added(self, ev: SSEEvent) -> Iterable[Dict[str, Any]]:
         """Handle response.output_item.added events and emit chunks as needed."""
+        obj = ev.json
         if not isinstance(obj, dict):
             return []
         item_type = obj.get("item", {}).get("type")
@@ -131,9 +142,7 @@ class ResponseAdapter:
             return out
         return []
 
-    def _function_call_arguments__delta(
-        self, obj: Optional[Dict[str, Any]]
-    ) -> Iterable[Dict[str, Any]]:
+    def _function_call_arguments__delta(self, ev: SSEEvent) -> Iterable[Dict[str, Any]]:
         """Handle response.function_call.arguments.delta events."""
         out: list[Dict[str, Any]] = []
         if getattr(self, "_thinking", False):
@@ -143,7 +152,7 @@ class ResponseAdapter:
                 )
             )
             self._thinking = False
-        arguments_delta = obj.get("delta", "") if isinstance(obj, dict) else ""
+        arguments_delta = ev.delta
         out.append(
             self._build_completion_chunk(
                 delta={
@@ -155,16 +164,12 @@ class ResponseAdapter:
         )
         return out
 
-    def _output_item__done(
-        self, obj: Optional[Dict[str, Any]]
-    ) -> Optional[Iterable[Dict[str, Any]]]:
+    def _output_item__done(self, ev: SSEEvent) -> Optional[Iterable[Dict[str, Any]]]:
         """Handle response.output_item.done events (no-op for completions)."""
         # No-op for completions mapping
         return None
 
-    def _reasoning_summary_text__delta(
-        self, obj: Optional[Dict[str, Any]]
-    ) -> Iterable[Dict[str, Any]]:
+    def _reasoning_summary_text__delta(self, ev: SSEEvent) -> Iterable[Dict[str, Any]]:
         """Handle reasoning.summary_text.delta events and emit text chunks."""
         out: list[Dict[str, Any]] = []
         if getattr(self, "_started_thinking", False):
@@ -179,24 +184,20 @@ class ResponseAdapter:
             self._build_completion_chunk(
                 delta={
                     "role": "assistant",
-                    "content": (obj.get("delta", "") if isinstance(obj, dict) else ""),
+                    "content": ev.delta,
                 }
             )
         )
         return out
 
-    def _reasoning_summary_text__done(
-        self, obj: Optional[Dict[str, Any]]
-    ) -> Iterable[Dict[str, Any]]:
+    def _reasoning_summary_text__done(self, ev: SSEEvent) -> Iterable[Dict[str, Any]]:
         """Handle reasoning.summary_text.done events and close think block."""
         return [
             self._build_completion_chunk(delta={"role": "assistant", "content": "\n\n"})
         ]
 
-    def _output_text__delta(
-        self, obj: Optional[Dict[str, Any]]
-    ) -> Iterable[Dict[str, Any]]:
-        """Handle response.output_text.delta events and emit text chunks."""
+    def _output_text__delta(self, ev: SSEEvent) -> Iterable[Dict[str, Any]]:
+        """Handle response.output_text.delta events and buffer text for merging."""
         out: list[Dict[str, Any]] = []
         if getattr(self, "_thinking", False):
             out.append(
@@ -205,15 +206,55 @@ class ResponseAdapter:
                 )
             )
             self._thinking = False
-        out.append(
+        delta = ev.delta
+        if not self._pending_text:
+            self._pending_since = time.monotonic()
+        self._pending_text.append(delta)
+        self._pending_len += len(delta)
+        if (
+            self._pending_len >= COALESCE_MAX_CHARS
+            or time.monotonic() - self._pending_since >= COALESCE_MAX_DELAY
+        ):
+            out.extend(self._flush_text())
+        return out
+
+    def _flush_text(self) -> List[Dict[str, Any]]:
+        """Emit buffered output text as a single chunk (if any is pending)."""
+        if not self._pending_text:
+            return []
+        content = "".join(self._pending_text)
+        self._pending_text = []
+        self._pending_len = 0
+        return [
             self._build_completion_chunk(
-                delta={
-                    "role": "assistant",
-                    "content": (obj.get("delta", "") if isinstance(obj, dict) else ""),
-                }
+                delta={"role": "assistant", "content": content}
             )
-        )
-        return out
+        ]
+
+    # Upstream event name -> handler, resolved with a single dict lookup per event
+    _HANDLERS: Dict[str, Callable[..., Optional[Iterable[Dict[str, Any]]]]] = {
+        "response.output_item.added": _output_item__added,
+        "response.output_item.done": _output_item__done,
+        "response.function_call_arguments.delta": _function_call_arguments__delta,
+        "response.reasoning_summary_text.delta": _reasoning_summary_text__delta,
+        "response.reasoning_summary_text.done": _reasoning_summary_text__done,
+        "response.output_text.delta": _output_text__delta,
+    }
+
+    def _dispatch(self, ev: SSEEvent) -> Iterator[Dict[str, Any]]:
+        """Run the handler for one upstream event and yield resulting chunks."""
+        if ev.is_done:
+            # Upstream [DONE] sentinel
+            return
+        handler = self._HANDLERS.get(ev.event)
+        if handler is None:
+            return
+        if ev.event != "response.output_text.delta":
+            # Buffered text must go out before any other kind of chunk
+            yield from self._flush_text()
+        res = handler(self, ev)
+        if res is not None:
+            yield from res
 
     def adapt(self, upstream_resp: Any) -> Response:
         """Adapt an upstream Azure streaming response into SSE for Flask."""
@@ -221,30 +262,34 @@ class ResponseAdapter:
         def generate() -> Iterable[bytes]:
             # Generate once per stream
             self._chat_completion_id = self._create_chat_completion_id()
+            self._chunk_skeleton = {
+                "id": self._chat_completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": self.adapter.inbound_model,
+            }
             # Initialize per-stream state on the instance
             self._started_thinking = False
             self._thinking = False
             self._called_function = False
+            self._pending_text = []
+            self._pending_len = 0
+            self._pending_since = 0.0
 
             def gen_dicts() -> Iterable[Dict[str, Any]]:
+                decoder = SSEDecoder()
                 try:
-                    for ev in sse_to_events(
-                        upstream_resp.iter_content(chunk_size=8192)
+                    for data in upstream_resp.iter_content(
+                        chunk_size=UPSTREAM_READ_SIZE
                     ):
-                        if ev.is_done:
-                            # Upstream [DONE] sentinel
-                            continue
-                        handler_name = "_" + (ev.event or "").replace(
-                            "response.", ""
-                        ).replace(".", "__")
-                        handler = getattr(self, handler_name, None)
-                        if not handler:
-                            continue
-                        res = handler(ev.json)
-                        if res is not None:
-                            for chunk in res:
-                                yield chunk
+                        for ev in decoder.feed(data):
+                            yield from self._dispatch(ev)
+                        # Don't hold merged text back while waiting on upstream
+                        yield from self._flush_text()
+                    for ev in decoder.end_of_input():
+                        yield from self._dispatch(ev)
                 finally:
+                    yield from self._flush_text()
                     # Emit finish reason at the end of stream
                     if getattr(self, "_called_function", False):
                         yield self._build_completion_chunk(finish_reason="tool_calls")
@@ -258,15 +303,16 @@ class ResponseAdapter:
                 upstream_resp.close()
 
         headers = self._filter_response_headers(
-            dict(getattr(upstream_resp, "headers", {})), streaming=True
+            getattr(upstream_resp, "headers", {}), streaming=True
         )
         headers["Content-Type"] = "text/event-stream; charset=utf-8"
         headers.pop("Content-Length", None)
         headers["Cache-Control"] = "no-cache"
         headers["Connection"] = "keep-alive"
         headers["X-Accel-Buffering"] = "no"
+        # Keep the app context while streaming (config lookups, recording)
         return Response(
-            generate(),
+            stream_with_context(generate()),
             status=getattr(upstream_resp, "status_code", 200),
             headers=headers,
         )
@@ -6,19 +6,30 @@ forwards incoming HTTP requests to the configured backend implementation.
 
 import sys
 
-from flask import Blueprint, jsonify, request
+import orjson
+from flask import Blueprint, Response, request
 from loguru import logger
 from rich.traceback import install as install_rich_traceback
 
 from .auth import require_auth
 from .azure.adapter import AzureAdapter
 from .common.logging import log_request
-from .common.recording import increment_last_recording, record_payload
+from .common.recording import (
+    increment_last_recording,
+    record_payload,
+    recording_enabled,
+)
 
 blueprint = Blueprint("blueprint", __name__)
 
-# Pretty tracebacks for easier debugging
-install_rich_traceback(show_locals=False)
+
+@blueprint.record_once
+def _install_rich_traceback(state) -> None:
+    """Install Rich tracebacks when the app runs in debug (development) mode."""
+    # Pretty tracebacks for easier debugging; production keeps the plain,
+    # cheaper-to-render and log-friendly default excepthook
+    if state.app.debug:
+        install_rich_traceback(show_locals=False)
 
 
 # Configure Loguru to print colorful logs to stdout
@@ -50,10 +61,13 @@ ALL_METHODS = [
 ]
 
 
+_HEALTH_BODY = b'{"status":"ok"}'
+
+
 @blueprint.route("/health", methods=["GET"])
 def health():
     """Return a simple health check payload."""
-    return jsonify({"status": "ok"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 @blueprint.route("/", defaults={"path": ""}, methods=ALL_METHODS)
@@ -67,40 +81,46 @@ def catch_all(path: str):
     returns a 502 JSON error payload.
     """
     log_request(request)
-    increment_last_recording()
-    record_payload(request.json, "downstream_request")
+    if recording_enabled():
+        # Checked here so the body is only parsed a second time when recording
+        increment_last_recording()
+        record_payload(request.get_json(silent=True), "downstream_request")
     adapter = AzureAdapter()
     return adapter.forward(request)
 
 
+# Static model list served by /models; the body is serialized once at import
+_MODELS = [
+    "gpt-4.1-high",
+    "gpt-4.1-medium",
+    "gpt-4.1-low",
+    "gpt-5",
+    "gpt-5-high",
+    "openai/gpt-high",
+    "openai/gpt-5",
+    "custom/gpt-high",
+    "foo",
+    "high",
+]
+_MODELS_BODY = orjson.dumps(
+    {
+        "object": "list",
+        "data": [
+            {
+                "id": model,
+                "object": "model",
+                "created": 1686935002,
+                "owned_by": "openai",
+            }
+            for model in _MODELS
+        ],
+    }
+)
+
+
 @blueprint.route("/models", methods=["GET"])
 @blueprint.route("/v1/models", methods=["GET"])
 @require_auth
 def models():
     """Return a list of available models."""
-    models = [
-        "gpt-4.1-high",
-        "gpt-4.1-medium",
-        "gpt-4.1-low",
-        "gpt-5",
-        "gpt-5-high",
-        "openai/gpt-high",
-        "openai/gpt-5",
-        "custom/gpt-high",
-        "foo",
-        "high",
-    ]
-    return jsonify(
-        {
-            "object": "list",
-            "data": [
-                {
-                    "id": model,
-                    "object": "model",
-                    "created": 1686935002,
-                    "owned_by": "openai",
-                }
-                for model in models
-            ],
-        }
-    )
+    return Response(_MODELS_BODY, mimetype="application/json")
@@ -0,0 +1,30 @@
+"""Flask JSON provider backed by orjson.
+
+Used for request.get_json()/request.json and jsonify so inbound payloads and
+small JSON responses share the same fast (de)serializer as the proxy paths.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Drop-in replacement for Flask's default provider using orjson.
+
+    Output is always compact UTF-8; the indent/ensure_ascii options of the
+    default provider are ignored. Types orjson can't handle natively fall back
+    to the default provider's ``default`` hook.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string."""
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
@@ -1,12 +1,13 @@
 """Utilities for structured, pretty logging of requests and SSE events."""
 
 import json
-import os
+import re
+import secrets
 import time
-import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
 
-from flask import Request
+from flask import Request, current_app
+from loguru import logger
 from rich.console import Console
 from rich.json import JSON
 from rich.markdown import Markdown
@@ -21,15 +22,44 @@ console = Console()
 
 # --- Request logging helpers ---
 
+# Whether to redact sensitive values (LOG_REDACT), cached once at startup by
+# init_app(); redaction stays on until then
+_REDACT_ENABLED = True
+
+# Header names (lowercase) whose values are always redacted
+_SENSITIVE_HEADERS = frozenset(
+    {
+        "authorization",
+        "proxy-authorization",
+        "x-api-key",
+        "api-key",
+        "api_key",
+        "x-azure-openai-key",
+        "azure-openai-key",
+    }
+)
+
+
+# Header names containing any of these fragments are redacted as well
+_SENSITIVE_NAME_RE = re.compile(
+    r"api[-_]?key|secret|token|passw(?:or)?d|credential|signature|session|cookie"
+)
+
+# Values that look like credentials regardless of the header name
+_SENSITIVE_VALUE_RE = re.compile(
+    r"Bearer |sk-ant-|sk-|AKIA|AIza|gh[pousr]_|(?:sk|pk|rk)_(?:test|live)_"
+)
+
+
+def init_app(app) -> None:
+    """Cache the configured LOG_REDACT flag for request-time redaction."""
+    global _REDACT_ENABLED
+    _REDACT_ENABLED = bool(app.config["LOG_REDACT"])
+
 
 def should_redact() -> bool:
     """Return True if sensitive values should be redacted in logs."""
-    # Set LOG_REDACT=false to disable redaction (default True)
-    return os.environ.get("LOG_REDACT", "true").strip().lower() not in {
-        "0",
-        "false",
-        "no",
-    }
+    return _REDACT_ENABLED
 
 
 def redact_value(value: str) -> str:
@@ -41,31 +71,29 @@ def redact_value(value: str) -> str:
     return value[:4] + "…" + value[-4:]
 
 
-def redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
-    """Return a copy of headers with sensitive values redacted when enabled."""
-    if not should_redact():
-        return dict(headers)
+def redact_headers(
+    headers: Union[Mapping[str, str], Iterable[Tuple[str, str]]],
+) -> Dict[str, str]:
+    """Return a dict of headers with sensitive values redacted when enabled.
+
+    Accepts a mapping or any iterable of (name, value) pairs, such as
+    werkzeug's request headers, and builds the output in a single pass.
+    """
+    items = headers.items() if isinstance(headers, Mapping) else headers
+    if not _REDACT_ENABLED:
+        return dict(items)
     redacted: Dict[str, str] = {}
-    sensitive = {
-        "authorization",
-        "proxy-authorization",
-        "x-api-key",
-        "api-key",
-        "api_key",
-        "x-azure-openai-key",
-        "azure-openai-key",
-    }
-    for k, v in headers.items():
-        if k.lower() in sensitive:
+    for k, v in items:
+        name = k.lower()
+        if (
+            name in _SENSITIVE_HEADERS
+            or _SENSITIVE_NAME_RE.search(name)
+            # Heuristic: mask common bearer/api-key looking values
+            or (isinstance(v, str) and _SENSITIVE_VALUE_RE.match(v))
+        ):
             redacted[k] = redact_value(v)
         else:
-            # Heuristic: mask common bearer/api-key looking values
-            if isinstance(v, str) and (
-                v.startswith("Bearer ") or v.startswith("sk-") or "api_key" in k.lower()
-            ):
-                redacted[k] = redact_value(v)
-            else:
-                redacted[k] = v
+            redacted[k] = v
     return redacted
 
 
@@ -92,11 +120,15 @@ def files_summary(req: Request) -> List[Dict[str, Any]]:
     return items
 
 
+def _request_path(req: Request) -> str:
+    """Return the proxied path of a catch-all request, with a leading slash."""
+    return "/" + (req.view_args.get("path", "") if req.view_args else "")
+
+
 def _capture_request_details(req: Request, request_id: str) -> Dict[str, Any]:
     """Collect a structured snapshot of request information for logging."""
     # Note: access request inside request context
-    hdrs = {k: v for k, v in req.headers.items()}
-    redacted_headers = redact_headers(hdrs)
+    redacted_headers = redact_headers(req.headers)
 
     details: Dict[str, Any] = {
         "id": request_id,
@@ -104,7 +136,7 @@ def _capture_request_details(req: Request, request_id: str) -> Dict[str, Any]:
         "remote_addr": (req.headers.get("X-Forwarded-For") or req.remote_addr or ""),
         "method": req.method,
         "scheme": req.scheme,
-        "path": "/" + (req.view_args.get("path", "") if req.view_args else ""),
+        "path": _request_path(req),
         "full_path": req.full_path,  # includes trailing ?
         "url": req.url,
         "route_args": dict(req.view_args or {}),
@@ -120,10 +152,40 @@ def _capture_request_details(req: Request, request_id: str) -> Dict[str, Any]:
 
 
 def log_request(req: Request) -> str:
-    """Pretty-print a Flask request using Rich and return the request id."""
-    request_id = uuid.uuid4().hex[:8]
-    details = _capture_request_details(req, request_id)
+    """Log a Flask request and return the request id.
 
+    The full request is pretty-printed with Rich when LOG_PRETTY is enabled;
+    otherwise a single structured line is emitted through loguru.
+    """
+    # 8 hex chars, drawing only the 4 random bytes actually used
+    request_id = secrets.token_hex(4)
+    if current_app.config["LOG_PRETTY"]:
+        _render_rich(_capture_request_details(req, request_id))
+    else:
+        # Only what the log line needs: no form/files/cookies/header parsing
+        method = req.method
+        path = _request_path(req)
+        logger.bind(request_id=request_id, method=method, path=path).info(
+            "Request #{} — {} {}", request_id, method, path
+        )
+    return request_id
+
+
+# Angle-bracket tags in messages are shown as inline code on their own lines;
+# ">\n<" maps straight to the compacted form of two separate replacements
+_ANGLE_RE = re.compile(r">\n<|[<>]")
+_ANGLE_REPL = {"<": "\n`<", ">": ">`\n", ">\n<": ">`\n\n`<"}
+
+
+def _fence_angle_brackets(text: str) -> str:
+    """Wrap angle-bracket tags in backticks so Markdown shows them verbatim."""
+    if "<" not in text and ">" not in text:
+        return text
+    return _ANGLE_RE.sub(lambda m: _ANGLE_REPL[m.group()], text)
+
+
+def _render_rich(details: Dict[str, Any]) -> None:
+    """Pretty-print captured request details using Rich."""
     method = details.get("method")
     path = details.get("path") or "/"
     rid = details.get("id")
@@ -206,12 +268,7 @@ def log_request(req: Request) -> str:
             console.rule(title)
             console.print(
                 Padding(
-                    Markdown(
-                        render_content(content_val)
-                        .replace("<", "\n`<")
-                        .replace(">", ">`\n")
-                        .replace(">`\n\n\n`<", ">`\n\n`<")
-                    ),
+                    Markdown(_fence_angle_brackets(render_content(content_val))),
                     (1, 0),
                 )
             )
@@ -241,8 +298,6 @@ def log_request(req: Request) -> str:
             if tool_calls:
                 console.print()
 
-    return request_id
-
 
 # --- SSE logging helpers ---
 
@@ -256,15 +311,15 @@ def _clean_payload(obj: Any) -> Any:
     """
     if not isinstance(obj, dict):
         return obj
-    # Shallow copy top-level
-    cleaned = {k: v for k, v in obj.items()}
-    if "tools" in cleaned:
-        cleaned = {k: v for k, v in cleaned.items() if k != "tools"}
-    resp = cleaned.get("response")
-    if isinstance(resp, dict) and "tools" in resp:
+    resp = obj.get("response")
+    has_nested = isinstance(resp, dict) and "tools" in resp
+    if not has_nested and "tools" not in obj:
+        # Nothing to drop (the common case): skip the copy entirely
+        return obj
+    cleaned = {k: v for k, v in obj.items() if k != "tools"}
+    if has_nested:
         # Shallow copy nested response to drop tools
-        new_resp = {k: v for k, v in resp.items() if k != "tools"}
-        cleaned = {**cleaned, "response": new_resp}
+        cleaned["response"] = {k: v for k, v in resp.items() if k != "tools"}
     return cleaned
 
 
@@ -5,29 +5,65 @@ monotonically increasing numeric prefix so related request/response files are
 easy to correlate.
 """
 
-import json
+import atexit
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import orjson
 from flask import current_app, has_app_context
 
 RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "recordings")
 
-# Private, module-level counter tracking the latest recording index.
-__LAST_RECORDING_INDEX = 0
+# Private, module-level counter tracking the latest recording index. Loaded
+# lazily on first use so importing this module never touches the disk.
+__LAST_RECORDING_INDEX: Optional[int] = None
 
-# Initialize the counter based on existing files in the recordings directory so
-# that subsequent runs continue incrementing from the maximum observed index.
-files = os.listdir(RECORDINGS_DIR)
-for file in files:
+# Small file persisting the latest index, so restarts don't rescan the folder
+INDEX_FILE_NAME = ".index"
+
+
+# Single writer thread so disk I/O stays off the request path while files are
+# still written in submission order; pending writes are flushed on exit.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recording")
+atexit.register(_IO_EXECUTOR.shutdown, wait=True)
+
+
+def _write_bytes(file_path: str, data: bytes) -> None:
+    """Write data to file_path, replacing any previous content."""
+    with open(file_path, "wb") as f:
+        f.write(data)
+
+
+def _load_last_recording_index() -> int:
+    """Return the latest recording index from the index file or a folder scan."""
     try:
-        recording_index = int(file.split("_")[0])
-        if recording_index > __LAST_RECORDING_INDEX:
-            __LAST_RECORDING_INDEX = recording_index
-    except (ValueError, IndexError):
-        # Ignore unrelated files that do not follow the "<index>_<name>.*" pattern
+        with open(os.path.join(RECORDINGS_DIR, INDEX_FILE_NAME), "rb") as f:
+            return int(f.read())
+    except (OSError, ValueError):
         pass
+    # No usable index file: continue from the maximum index found on disk
+    last = 0
+    with os.scandir(RECORDINGS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name[:1].isdigit():
+                # Skip unrelated files (.gitkeep, .index, ...) without parsing
+                continue
+            try:
+                recording_index = int(name.partition("_")[0])
+            except ValueError:
+                # Ignore files that do not follow the "<index>_<name>.*" pattern
+                continue
+            if recording_index > last:
+                last = recording_index
+    return last
+
+
+def recording_enabled() -> bool:
+    """Return True if RECORD_TRAFFIC is enabled for the current app."""
+    return has_app_context() and bool(current_app.config["RECORD_TRAFFIC"])
 
 
 def config_bypass(func):
@@ -35,10 +71,7 @@ def config_bypass(func):
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        enabled = False
-        if has_app_context():
-            enabled = current_app.config["RECORD_TRAFFIC"]
-        if not enabled:
+        if not recording_enabled():
             return None
         return func(*args, **kwargs)
 
@@ -50,7 +83,14 @@ def increment_last_recording() -> None:
     """Advance the shared recording index for a new request lifecycle."""
 
     global __LAST_RECORDING_INDEX
+    if __LAST_RECORDING_INDEX is None:
+        __LAST_RECORDING_INDEX = _load_last_recording_index()
     __LAST_RECORDING_INDEX += 1
+    _IO_EXECUTOR.submit(
+        _write_bytes,
+        os.path.join(RECORDINGS_DIR, INDEX_FILE_NAME),
+        str(__LAST_RECORDING_INDEX).encode("ascii"),
+    )
 
 
 @config_bypass
@@ -59,8 +99,9 @@ def record_payload(payload: Dict[str, Any], name: str) -> None:
 
     file_name = f"{__LAST_RECORDING_INDEX}_{name}.json"
     file_path = os.path.join(RECORDINGS_DIR, file_name)
-    with open(file_path, "w") as f:
-        json.dump(payload, f, indent=2)
+    # Serialize now: the payload may be mutated once the request moves on
+    data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    _IO_EXECUTOR.submit(_write_bytes, file_path, data)
 
 
 @config_bypass
@@ -69,5 +110,4 @@ def record_sse(sse: bytes, name: str) -> None:
 
     file_name = f"{__LAST_RECORDING_INDEX}_{name}.sse"
     file_path = os.path.join(RECORDINGS_DIR, file_name)
-    with open(file_path, "wb") as f:
-        f.write(sse)
+    _IO_EXECUTOR.submit(_write_bytes, file_path, bytes(sse))
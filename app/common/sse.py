@@ -6,14 +6,46 @@ This module provides helpers to decode and encode SSE streams, including:
 - Helpers to encode Python values back into SSE-formatted bytes
 """
 
-import json
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .recording import record_sse
+import orjson
 
+from .recording import record_sse, recording_enabled
 
-@dataclass
+# Compact key prefix used by the Responses API for streamed text deltas
+_DELTA_KEY = '"delta":"'
+
+
+def _extract_json_string(text: str, start: int) -> Optional[str]:
+    """Return the JSON string value whose body starts at ``start``.
+
+    Finds the closing unescaped quote and only runs a JSON decode on the value
+    when it contains escape sequences. Returns None if the string is unterminated
+    or contains an invalid escape.
+    """
+    end = text.find('"', start)
+    while end != -1:
+        # A quote preceded by an odd number of backslashes is escaped
+        i = end - 1
+        while i >= start and text[i] == "\\":
+            i -= 1
+        if (end - 1 - i) % 2 == 0:
+            break
+        end = text.find('"', end + 1)
+    if end == -1:
+        return None
+    value = text[start:end]
+    if "\\" not in value:
+        return value
+    try:
+        return orjson.loads(text[start - 1 : end + 1])
+    except orjson.JSONDecodeError:
+        return None
+
+
+# Slotted: long streams create thousands of events, so skip the per-instance dict
+@dataclass(slots=True)
 class SSEEvent:
     """A parsed Server-Sent Event.
 
@@ -34,6 +66,15 @@ class SSEEvent:
     # Lazy JSON cache (computed on first access of .json)
     _json_cached: bool = field(default=False, init=False, repr=False)
     _json_value: Optional[Any] = field(default=None, init=False, repr=False)
+    # Stripped data shared by .is_done and .json (computed on first use)
+    _stripped: Optional[str] = field(default=None, init=False, repr=False)
+
+    def _stripped_data(self) -> str:
+        """Return the data without surrounding whitespace, stripping only once."""
+        text = self._stripped
+        if text is None:
+            text = self._stripped = self.data.strip() if self.data else ""
+        return text
 
     @property
     def is_done(self) -> bool:
@@ -41,7 +82,7 @@ class SSEEvent:
 
         The end-of-stream sentinel is the literal string "[DONE]".
         """
-        return self.data.strip() == "[DONE]"
+        return self._stripped_data() == "[DONE]"
 
     @property
     def json(self) -> Optional[Any]:
@@ -51,18 +92,36 @@ class SSEEvent:
         """
         if not self._json_cached:
             val: Optional[Any]
-            text = (self.data or "").strip()
-            if self.is_done or not text:
+            text = self._stripped_data()
+            if not text or text == "[DONE]":
                 val = None
             else:
                 try:
-                    val = json.loads(text)
-                except json.JSONDecodeError:
+                    val = orjson.loads(text)
+                except orjson.JSONDecodeError:
                     val = None
             self._json_value = val
             self._json_cached = True
         return self._json_value
 
+    @property
+    def delta(self) -> str:
+        """Return the top-level "delta" string without parsing the whole payload.
+
+        Delta events are flat objects, so the value is sliced straight out of
+        the data. Falls back to the full JSON parse when the fast path does not
+        apply; missing, non-string or undecodable deltas yield "".
+        """
+        if not self._json_cached:
+            idx = self.data.find(_DELTA_KEY)
+            if idx != -1:
+                value = _extract_json_string(self.data, idx + len(_DELTA_KEY))
+                if value is not None:
+                    return value
+        obj = self.json
+        value = obj.get("delta") if isinstance(obj, dict) else None
+        return value if isinstance(value, str) else ""
+
 
 class SSEDecoder:
     """Incremental SSE decoder.
@@ -74,68 +133,72 @@ class SSEDecoder:
     def __init__(self, encoding: str = "utf-8") -> None:
         """Initialize the decoder with the given text encoding."""
         self.encoding = encoding
-        self.buffer: bytes = b""
-        self.full_buffer: bytes = b""
+        # Pending bytes after the last complete line
+        self.buffer = bytearray()
+        # Length of self.buffer already known to contain no newline
+        self._scanned: int = 0
+        # Raw copy of the stream, only kept when traffic recording is on
+        self._record = recording_enabled()
+        self.full_buffer = bytearray()
         self._event_lines: List[bytes] = []
         self._seq: int = 0
 
     def _parse_event(self, lines: List[bytes]) -> SSEEvent:
         ev_type: Optional[str] = None
-        data_parts: List[bytes] = []
+        data_buf = bytearray()
         ev_id: Optional[str] = None
         retry: Optional[int] = None
+        encoding = self.encoding
 
         for line in lines:
-            if not line:
+            # One search per line; the field name is everything before it
+            colon = line.find(b":")
+            if colon <= 0:
+                # Comment line (leading colon) or no field name, ignore
                 continue
-            if line.startswith(b"event:"):
-                ev_type = (
-                    line.split(b":", 1)[1]
-                    .strip()
-                    .decode(self.encoding, errors="replace")
-                )
-            elif line.startswith(b"data:"):
-                part = line[5:]
-                if part.startswith(b" "):
-                    part = part[1:]
-                data_parts.append(part)
-            elif line.startswith(b"id:"):
-                val = line.split(b":", 1)[1]
-                if val.startswith(b" "):
-                    val = val[1:]
-                ev_id = val.decode(self.encoding, errors="replace")
-            elif line.startswith(b"retry:"):
-                val = line.split(b":", 1)[1]
-                if val.startswith(b" "):
-                    val = val[1:]
+            name = line[:colon]
+            value = line[colon + 1 :]
+            if value[:1] == b" ":
+                value = value[1:]
+            # Ordered by frequency: nearly every line is data
+            if name == b"data":
+                data_buf += value
+                data_buf += b"\n"
+            elif name == b"event":
+                ev_type = value.strip().decode(encoding, errors="replace")
+            elif name == b"id":
+                ev_id = value.decode(encoding, errors="replace")
+            elif name == b"retry":
                 try:
-                    retry = int(val.strip())
+                    retry = int(value.strip())
                 except ValueError:
                     retry = None
-            elif line.startswith(b":"):
-                # Comment line, ignore
-                pass
-
-        data_text = (
-            b"\n".join(data_parts).decode(self.encoding, errors="replace")
-            if data_parts
-            else ""
-        )
+
+        # Drop the newline appended after the last data line
+        del data_buf[-1:]
+        data_text = data_buf.decode(encoding, errors="replace")
         return SSEEvent(event=ev_type, data=data_text, id=ev_id, retry=retry)
 
     def feed(self, chunk: bytes) -> Iterator[SSEEvent]:
         """Feed a new bytes chunk and yield any complete parsed events."""
         if not chunk:
             return
-        self.buffer += chunk
-        self.full_buffer += chunk
-        while True:
-            idx = self.buffer.find(b"\n")
-            if idx == -1:
-                break
-            line = self.buffer[: idx + 1]
-            self.buffer = self.buffer[idx + 1 :]
-            stripped = line.rstrip(b"\r\n")
+        buffer = self.buffer
+        buffer += chunk
+        if self._record:
+            self.full_buffer += chunk
+        # Split every complete line in one pass; only the trailing partial line
+        # stays buffered, so total work is linear in the stream size
+        end = buffer.rfind(b"\n", self._scanned)
+        if end == -1:
+            self._scanned = len(buffer)
+            lines: List[bytes] = []
+        else:
+            lines = bytes(buffer[:end]).split(b"\n")
+            del buffer[: end + 1]
+            self._scanned = len(buffer)
+        for line in lines:
+            stripped = line.rstrip(b"\r")
             if stripped == b"":
                 if self._event_lines:
                     ev = self._parse_event(self._event_lines)
@@ -145,7 +208,6 @@ class SSEDecoder:
                 self._event_lines = []
             else:
                 self._event_lines.append(stripped)
-        record_sse(self.full_buffer, "upstream_response")
 
     def end_of_input(self) -> Iterator[SSEEvent]:
         """Flush and yield a trailing event if the stream ended mid-message."""
@@ -156,6 +218,9 @@ class SSEDecoder:
             ev.index = self._seq
             yield ev
             self._event_lines = []
+        if self._record:
+            # Written once at the end instead of re-dumping after every chunk
+            record_sse(self.full_buffer, "upstream_response")
 
 
 def sse_to_events(
@@ -163,8 +228,9 @@ def sse_to_events(
 ) -> Iterator[SSEEvent]:
     """Convert an SSE byte-stream into parsed SSEEvent objects."""
     decoder = SSEDecoder(encoding=encoding)
+    feed = decoder.feed
     for chunk in stream:
-        yield from decoder.feed(chunk)
+        yield from feed(chunk)
     yield from decoder.end_of_input()
 
 
@@ -177,12 +243,8 @@ def sse_to_chunks(
     - Uses event.json to avoid repeated json.loads
     - Skips the [DONE] sentinel by default
     """
-    for ev in sse_to_events(stream, encoding=encoding):
-        if skip_done and ev.is_done:
-            continue
-        if ev.json is None:
-            continue
-        yield ev.json
+    for _, obj in sse_to_json_events(stream, skip_done=skip_done, encoding=encoding):
+        yield obj
 
 
 def sse_to_json_events(
@@ -190,16 +252,13 @@ def sse_to_json_events(
 ) -> Iterator[Tuple[Optional[str], Dict[str, Any]]]:
     """Yield (event, json_obj) pairs for events whose data parses as JSON.
 
-    Non-JSON events are skipped. The [DONE] sentinel is skipped if skip_done
-    is True.
+    Non-JSON events are skipped. The [DONE] sentinel never parses as JSON,
+    so it is skipped as well (skip_done is kept for API compatibility).
     """
     for ev in sse_to_events(stream, encoding=encoding):
-        if skip_done and ev.is_done:
-            continue
         obj = ev.json
-        if obj is None:
-            continue
-        yield (ev.event, obj)
+        if obj is not None:
+            yield (ev.event, obj)
 
 
 def encode_sse_data(
@@ -211,23 +270,26 @@ def encode_sse_data(
     as per the SSE spec. Optionally include event and id.
     """
     out = bytearray()
+    extend = out.extend
     if id is not None:
-        out.extend(b"id: ")
-        out.extend(id.encode("utf-8"))
-        out.extend(b"\n")
+        extend(b"id: ")
+        extend(id.encode("utf-8"))
+        extend(b"\n")
     if event is not None:
-        out.extend(b"event: ")
-        out.extend(event.encode("utf-8"))
-        out.extend(b"\n")
+        extend(b"event: ")
+        extend(event.encode("utf-8"))
+        extend(b"\n")
 
     if data == "":
-        out.extend(b"data:\n")
+        extend(b"data:\n")
     else:
-        for line in data.splitlines():
-            out.extend(b"data: ")
-            out.extend(line.encode("utf-8"))
-            out.extend(b"\n")
-    out.extend(b"\n")
+        # Encode once and split the bytes: only CR/LF end a line in SSE, so
+        # Unicode separators such as U+2028 stay inside the data line
+        for line in data.encode("utf-8").splitlines():
+            extend(b"data: ")
+            extend(line)
+            extend(b"\n")
+    extend(b"\n")
     return bytes(out)
 
 
@@ -235,7 +297,7 @@ def encode_sse_json(
     obj: Any, *, event: Optional[str] = None, id: Optional[str] = None
 ) -> bytes:
     """Encode a Python object as JSON in SSE format and return bytes."""
-    payload = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    payload = orjson.dumps(obj).decode("utf-8")
     return encode_sse_data(payload, event=event, id=id)
 
 
@@ -244,20 +306,33 @@ def chunks_to_sse(
 ) -> Iterator[bytes]:
     """Encode an iterator of JSON-able dicts into SSE byte messages.
 
-    If add_done is True, a final [DONE] sentinel event is yielded.
+    If add_done is True, a final [DONE] sentinel event is yielded. orjson
+    never emits raw newlines, so each chunk is a single "data:" line written
+    into one reused per-stream buffer.
     """
-    buffer = b""
+    # Downstream frames are only kept when traffic recording is on, and are
+    # joined once at the end instead of re-concatenated after every chunk
+    record = recording_enabled()
+    recorded: List[bytes] = []
+    frame = bytearray()
     try:
         for obj in chunks:
-            sse = encode_sse_json(obj)
-            buffer += sse
+            frame += b"data: "
+            frame += orjson.dumps(obj)
+            frame += b"\n\n"
+            sse = bytes(frame)
+            frame.clear()
+            if record:
+                recorded.append(sse)
             yield sse
     finally:
         if add_done:
             sse = done_event_bytes()
-            buffer += sse
+            if record:
+                recorded.append(sse)
             yield sse
-        record_sse(buffer, "downstream_response")
+        if record:
+            record_sse(b"".join(recorded), "downstream_response")
 
 
 def done_event_bytes() -> bytes:
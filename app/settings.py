@@ -14,6 +14,10 @@ env.read_env()
 ENV = env.str("FLASK_ENV", default="production")
 DEBUG = ENV == "development"
 RECORD_TRAFFIC = env.bool("RECORD_TRAFFIC", False)
+# Pretty-print every request with Rich (defaults to on in development only)
+LOG_PRETTY = env.bool("LOG_PRETTY", DEBUG)
+# Mask credentials in logged request headers (set to off to log them verbatim)
+LOG_REDACT = env.bool("LOG_REDACT", True)
 
 SERVICE_API_KEY = env.str("SERVICE_API_KEY", "change-me")
 
@@ -24,6 +28,8 @@ AZURE_DEPLOYMENT = env.str("AZURE_DEPLOYMENT") or "gpt-5"
 AZURE_API_VERSION = env.str("AZURE_API_VERSION") or "2025-04-01-preview"
 AZURE_SUMMARY_LEVEL = env.str("AZURE_SUMMARY_LEVEL") or "detailed"
 AZURE_TRUNCATION = env.str("AZURE_TRUNCATION") or "auto"
+# Pretty-print Azure errors with Rich (defaults to on in development only)
+AZURE_VERBOSE_ERRORS = env.bool("AZURE_VERBOSE_ERRORS", DEBUG)
 
 AZURE_RESPONSES_API_URL = (
     f"{AZURE_BASE_URL}/openai/responses?api-version={AZURE_API_VERSION}"
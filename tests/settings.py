@@ -11,8 +11,11 @@ AZURE_API_KEY = "test-api-key"
 AZURE_DEPLOYMENT = "gpt-5"
 AZURE_SUMMARY_LEVEL = "detailed"
 AZURE_TRUNCATION = "auto"
+AZURE_VERBOSE_ERRORS = False
 
 RECORD_TRAFFIC = False
+LOG_PRETTY = False
+LOG_REDACT = True
 
 
 AZURE_RESPONSES_API_URL = (
@@ -3,6 +3,36 @@
 See: http://webtest.readthedocs.org/
 """
 
+import json
+
+from app.azure import adapter as azure_adapter
+from app.common.sse import sse_to_chunks
+
+
+class FakeUpstream:
+    """Streamed Azure response yielding one SSE payload per read."""
+
+    status_code = 200
+    headers = {"Content-Type": "text/event-stream"}
+
+    def __init__(self, reads):
+        """Store the raw reads to replay."""
+        self.reads = reads
+
+    def iter_content(self, chunk_size=None):
+        """Yield each read as bytes."""
+        for read in self.reads:
+            yield read.encode("utf-8")
+
+    def close(self):
+        """Release the fake connection (nothing to do)."""
+
+
+def sse_event(name, **payload):
+    """Encode one Responses API event as SSE text."""
+    payload["type"] = name
+    return f"event: {name}\ndata: {json.dumps(payload)}\n\n"
+
 
 class TestConfig:
     """Config."""
@@ -21,6 +51,96 @@ class TestModels:
         """Ensure /models endpoint returns HTTP 200."""
         testapp.get("/models", status=401)
 
+    def test_models_endpoint_checks_bearer_token(self, testapp):
+        """Ensure /models only accepts the configured service API key."""
+        testapp.authorization = ("Bearer", "wrong-key")
+        testapp.get("/models", status=401)
+        testapp.authorization = ("Bearer", "test-service-api-key")
+        res = testapp.get("/models", status=200)
+        assert res.content_type == "application/json"
+        assert res.json["object"] == "list"
+        assert {
+            "id": "high",
+            "object": "model",
+            "created": 1686935002,
+            "owned_by": "openai",
+        } in res.json["data"]
+
     def test_health_endpoint_returns_200(self, testapp):
         """Ensure /health endpoint returns HTTP 200."""
         testapp.get("/health", status=200)
+
+
+class TestCompletions:
+    """Completions."""
+
+    def test_unknown_model_returns_400(self, testapp):
+        """Ensure an unsupported model name is rejected before calling Azure."""
+        testapp.authorization = ("Bearer", "test-service-api-key")
+        res = testapp.post_json(
+            "/v1/chat/completions",
+            {"model": "gpt-5", "messages": []},
+            status=400,
+        )
+        assert "gpt-high" in res.text
+
+    def test_body_is_parsed_regardless_of_content_type(self, testapp, monkeypatch):
+        """Ensure a JSON body sent as text/plain is still adapted and forwarded."""
+        captured = {}
+
+        def fake_request(**kwargs):
+            """Capture the upstream request kwargs."""
+            captured.update(kwargs)
+            return FakeUpstream([])
+
+        monkeypatch.setattr(azure_adapter._SESSION, "request", fake_request)
+        testapp.authorization = ("Bearer", "test-service-api-key")
+        testapp.post(
+            "/v1/chat/completions",
+            json.dumps(
+                {"model": "gpt-high", "messages": [{"role": "user", "content": "hi"}]}
+            ),
+            content_type="text/plain",
+            status=200,
+        )
+        body = json.loads(captured["data"])
+        assert body["reasoning"]["effort"] == "high"
+        assert body["input"] == [
+            {"role": "user", "content": [{"type": "input_text", "text": "hi"}]}
+        ]
+
+    def test_stream_merges_text_and_keeps_order(self, testapp, monkeypatch):
+        """Merge text deltas per read, flushing before other events and at the end."""
+        text = "response.output_text.delta"
+        reads = [
+            sse_event(text, delta="Hel") + sse_event(text, delta="lo"),
+            sse_event(text, delta=" there")
+            + sse_event(
+                "response.output_item.added",
+                item={"type": "function_call", "name": "f", "call_id": "c1"},
+            )
+            + sse_event("response.function_call_arguments.delta", delta="{}"),
+            sse_event(text, delta="x") + sse_event(text, delta=None),
+            sse_event(text, delta="y"),
+        ]
+        monkeypatch.setattr(
+            azure_adapter._SESSION, "request", lambda **kwargs: FakeUpstream(reads)
+        )
+        testapp.authorization = ("Bearer", "test-service-api-key")
+        res = testapp.post_json(
+            "/v1/chat/completions",
+            {"model": "gpt-high", "messages": [{"role": "user", "content": "hi"}]},
+            status=200,
+        )
+        assert res.body.endswith(b"data: [DONE]\n\n")
+        deltas = [
+            (c["choices"][0]["delta"], c["choices"][0]["finish_reason"])
+            for c in sse_to_chunks([res.body])
+        ]
+        contents = [d.get("content") for d, _ in deltas]
+        assert contents[:2] == ["Hello", " there"]
+        assert deltas[2][0]["tool_calls"][0]["function"]["name"] == "f"
+        assert deltas[3][0]["tool_calls"][0]["function"]["arguments"] == "{}"
+        # Text is flushed after each read and before the finish chunk
+        assert contents[4:6] == ["x", "y"]
+        assert deltas[6:] == [({}, "tool_calls")]
@@ -0,0 +1,56 @@
+"""Unit tests for the SSE helpers."""
+
+import json
+
+from app.common.sse import SSEEvent, chunks_to_sse, encode_sse_data, sse_to_chunks
+
+
+class TestSSEEventDelta:
+    """SSEEvent.delta."""
+
+    def test_plain_delta_is_sliced(self):
+        """Return unescaped deltas straight from the payload."""
+        ev = SSEEvent(event="response.output_text.delta", data='{"delta":"Hello"}')
+        assert ev.delta == "Hello"
+
+    def test_escaped_delta_matches_json(self):
+        """Decode escape sequences exactly like a full JSON parse."""
+        text = 'say \\"hi\\"\n\t é 😀  '
+        data = json.dumps(
+            {"item_id": 'x"delta":"y', "delta": text}, separators=(",", ":")
+        )
+        assert SSEEvent(event=None, data=data).delta == text
+
+    def test_falls_back_to_full_parse(self):
+        """Use the parsed JSON when the fast path does not apply."""
+        assert SSEEvent(event=None, data='{"delta": "spaced"}').delta == "spaced"
+        assert SSEEvent(event=None, data='{"other":1}').delta == ""
+        assert SSEEvent(event=None, data="not json").delta == ""
+
+    def test_invalid_or_non_string_delta_is_empty(self):
+        """Never raise on bad escapes and always return a str."""
+        assert SSEEvent(event=None, data='{"delta":"\\q"}').delta == ""
+        assert SSEEvent(event=None, data='{"delta": null}').delta == ""
+        assert SSEEvent(event=None, data='{"delta": 5}').delta == ""
+
+
+class TestChunksToSSE:
+    """chunks_to_sse."""
+
+    def test_round_trip(self):
+        """Encoded chunks decode back to the same objects, followed by [DONE]."""
+        chunks = [{"content": "a\u2028b\nc"}, {"content": "é 😀"}]
+        frames = list(chunks_to_sse(chunks))
+        assert frames[-1] == b"data: [DONE]\n\n"
+        assert all(frame.count(b"\n") == 2 for frame in frames)
+        assert list(sse_to_chunks(frames)) == chunks
+
+
+class TestEncodeSSEData:
+    """encode_sse_data."""
+
+    def test_splits_only_on_line_breaks(self):
+        """Split CR/LF into data lines but keep Unicode separators inline."""
+        encoded = encode_sse_data("a\r\nb\u2028c\nd", event="x")
+        assert encoded == "event: x\ndata: a\ndata: b\u2028c\ndata: d\n\n".encode()
+        assert encode_sse_data("") == b"data:\n\n"